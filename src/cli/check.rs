@@ -145,7 +145,9 @@ fn run_check_inner(
         }
         OutputFormat::Jsonl => {
             let formatter = JsonlFormatter::new();
-            print!("{}", formatter.format(&aggregation_result, verbose));
+            if let Err(e) = formatter.write_to_stdout(&aggregation_result, verbose) {
+                eprintln!("Error writing output: {}", e);
+            }
         }
     }
 
@@ -8,7 +8,8 @@ use crate::config::ratchet_toml::Config;
 use crate::engine::file_walker::{FileEntry, FileWalker, FileWalkerError};
 use crate::error::{ConfigError, RuleError};
 use crate::rules::RuleRegistry;
-use std::path::Path;
+use std::collections::HashSet;
+use std::path::{Path, PathBuf};
 
 /// Exit codes from DESIGN.md
 pub const EXIT_SUCCESS: i32 = 0;
@@ -58,7 +59,8 @@ pub(crate) fn discover_files(
 ///
 /// Walks the specified paths and collects all files that match the
 /// include/exclude patterns from the configuration. Optionally calls
-/// a callback for each file or skip event.
+/// a callback for each file or skip event. Files reached through more than
+/// one of the given paths (e.g. `src` and `src/engine`) are returned once.
 ///
 /// # Arguments
 ///
@@ -83,9 +85,30 @@ where
 
     let mut all_files = Vec::new();
 
+    // Only overlapping paths can yield the same file twice, so skip the
+    // bookkeeping when walking a single path
+    let dedupe = paths.len() > 1;
+    let mut seen: HashSet<PathBuf> = HashSet::new();
+
     for path_str in paths {
         let path = Path::new(path_str);
 
+        // Walkers prefix entries with the root as typed, so key the seen set
+        // on the absolute root plus the entry's path below it. This catches
+        // `src` vs `./src/x` while resolving the working directory once per root.
+        let absolute_root = if dedupe {
+            std::path::absolute(path).unwrap_or_else(|_| path.to_path_buf())
+        } else {
+            PathBuf::new()
+        };
+        let mut is_new = |file: &FileEntry| {
+            !dedupe
+                || seen.insert(match file.path.strip_prefix(path) {
+                    Ok(relative) => absolute_root.join(relative),
+                    Err(_) => file.path.clone(),
+                })
+        };
+
         // Create FileWalker with include/exclude patterns from config
         let walker = FileWalker::with_verbose(
             path,
@@ -99,8 +122,10 @@ where
             for result in walker.walk_with_skip_info() {
                 match result? {
                     WalkResult::File(file) => {
-                        callback(&format!("Scanning {}...", file.path.display()));
-                        all_files.push(file);
+                        if is_new(&file) {
+                            callback(&format!("Scanning {}...", file.path.display()));
+                            all_files.push(file);
+                        }
                     }
                     WalkResult::Skipped { path, reason } => {
                         let reason_str = match reason {
@@ -115,7 +140,9 @@ where
         } else {
             for result in walker.walk() {
                 let file = result?;
-                all_files.push(file);
+                if is_new(&file) {
+                    all_files.push(file);
+                }
             }
         }
     }
@@ -199,6 +226,49 @@ mod tests {
         assert_eq!(result.unwrap().len(), 0);
     }
 
+    #[test]
+    fn test_discover_files_overlapping_paths() {
+        let temp_dir = tempfile::TempDir::new().unwrap();
+        let src = temp_dir.path().join("src");
+        let nested = src.join("nested");
+        std::fs::create_dir_all(&nested).unwrap();
+        std::fs::write(src.join("lib.rs"), "fn lib() {}").unwrap();
+        std::fs::write(nested.join("inner.rs"), "fn nested() {}").unwrap();
+
+        let config = Config {
+            ratchets: crate::config::ratchet_toml::RatchetsMeta {
+                version: "1".to_string(),
+                languages: vec![Language::Rust],
+                include: vec![GlobPattern::new("**/*.rs")],
+                exclude: vec![],
+            },
+            rules: crate::config::ratchet_toml::RulesConfig {
+                builtin: std::collections::HashMap::new(),
+                custom: std::collections::HashMap::new(),
+            },
+            output: crate::config::ratchet_toml::OutputConfig::default(),
+            patterns: std::collections::HashMap::new(),
+        };
+
+        let paths = vec![
+            src.to_string_lossy().to_string(),
+            nested.to_string_lossy().to_string(),
+            src.to_string_lossy().to_string(),
+        ];
+        let files = discover_files(&paths, &config).unwrap();
+        assert_eq!(files.len(), 2);
+
+        // The same directories spelled differently
+        let root = temp_dir.path().to_string_lossy().to_string();
+        let paths = vec![
+            format!("{}/./src", root),
+            format!("{}/src/nested/", root),
+            format!("{}/src/./nested/inner.rs", root),
+        ];
+        let files = discover_files(&paths, &config).unwrap();
+        assert_eq!(files.len(), 2);
+    }
+
     #[test]
     fn test_build_registry_with_minimal_config() {
         let config = Config {
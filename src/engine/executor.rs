@@ -6,10 +6,16 @@
 //! to execute rules against discovered files in parallel using rayon.
 
 use crate::engine::file_walker::FileEntry;
-use crate::rules::{AstRule, ExecutionContext, ParserCache, Rule, RuleRegistry, Violation};
+use crate::rules::{
+    AstRule, ExecutionContext, LineIndex, ParserCache, RegexRule, Rule, RuleRegistry, Violation,
+};
 use crate::types::Language;
 use rayon::prelude::*;
-use std::fs;
+use std::collections::HashMap;
+use std::collections::hash_map::Entry;
+use std::fs::File;
+use std::io::Read;
+use std::ops::Range;
 use std::sync::Arc;
 
 /// Result of executing all rules against all files
@@ -23,6 +29,18 @@ pub struct ExecutionResult {
     pub rules_executed: usize,
 }
 
+/// State owned by a single rayon job and reused across the files in that job
+///
+/// Rayon's `map_init` creates one of these per split job rather than per
+/// thread, so a thread may build several over a run.
+#[derive(Default)]
+struct WorkerState {
+    /// Buffer that file contents are read into
+    buffer: String,
+    /// Parsers created by this job so far, one per language
+    parsers: HashMap<Language, tree_sitter::Parser>,
+}
+
 /// Execution engine that coordinates parallel rule execution
 ///
 /// The engine:
@@ -64,10 +82,13 @@ impl ExecutionEngine {
         let files_checked = files.len();
         let rules_executed = self.registry.len();
 
-        // Process files in parallel
+        // Process files in parallel, reusing a read buffer and parsers per rayon job
         let violations: Vec<Violation> = files
             .par_iter()
-            .flat_map(|file| self.execute_file(file))
+            .map_init(WorkerState::default, |state, file| {
+                self.execute_file(file, state)
+            })
+            .flatten_iter()
             .collect();
 
         ExecutionResult {
@@ -80,25 +101,16 @@ impl ExecutionEngine {
     /// Execute all applicable rules against a single file
     ///
     /// This method:
-    /// 1. Reads the file content
-    /// 2. Determines which rules apply (based on language and file path)
+    /// 1. Determines which rules apply (based on language and include/exclude patterns)
+    /// 2. Reads the file content, only if at least one rule applies
     /// 3. Parses AST if any AST rules apply
     /// 4. Executes all applicable rules
     /// 5. Collects violations
-    fn execute_file(&self, file: &FileEntry) -> Vec<Violation> {
-        // Read file content - if we can't read it, log warning and skip
-        let content = match fs::read_to_string(&file.path) {
-            Ok(content) => content,
-            Err(e) => {
-                eprintln!(
-                    "Warning: Failed to read file {}: {}",
-                    file.path.display(),
-                    e
-                );
-                return vec![];
-            }
-        };
-
+    ///
+    /// The file is read into the job's buffer, which is cleared first and
+    /// reused across the files of that job instead of allocating per file.
+    /// ASTs are parsed with the job's own parsers.
+    fn execute_file(&self, file: &FileEntry, state: &mut WorkerState) -> Vec<Violation> {
         // Collect all rules that apply to this file
         let applicable_rules: Vec<&dyn Rule> = self
             .registry
@@ -106,60 +118,90 @@ impl ExecutionEngine {
             .filter(|&rule| self.rule_applies_to_file(rule, file))
             .collect();
 
+        // Files no rule applies to are never read or decoded
         if applicable_rules.is_empty() {
             return vec![];
         }
 
-        // Group rules by type (AST vs Regex)
-        let (ast_rules, regex_rules): (Vec<&dyn Rule>, Vec<&dyn Rule>) = applicable_rules
-            .into_iter()
-            .partition(|&rule| self.is_ast_rule(rule));
+        // Read file content - if we can't read it, log warning and skip
+        let WorkerState { buffer, parsers } = state;
+        buffer.clear();
+        if let Err(e) = File::open(&file.path).and_then(|mut f| f.read_to_string(buffer)) {
+            eprintln!(
+                "Warning: Failed to read file {}: {}",
+                file.path.display(),
+                e
+            );
+            return vec![];
+        }
+        let content: &str = buffer;
+
+        // Group rules by type so AST rules can share one parse and regex
+        // rules can share one line index
+        let mut ast_rules: Vec<&AstRule> = Vec::new();
+        let mut regex_rules: Vec<&RegexRule> = Vec::new();
+        let mut other_rules: Vec<&dyn Rule> = Vec::new();
+        for rule in applicable_rules {
+            if let Some(regex_rule) = rule.as_regex_rule() {
+                regex_rules.push(regex_rule);
+            } else if let Some(ast_rule) = rule.as_ast_rule() {
+                ast_rules.push(ast_rule);
+            } else {
+                other_rules.push(rule);
+            }
+        }
 
         let mut all_violations = Vec::new();
 
+        // Rules for a single file run sequentially; parallelism comes from
+        // processing many files at once, which keeps each file's content and
+        // tree hot in one worker's cache and avoids nested rayon tasks
+        let ctx = ExecutionContext {
+            file_path: &file.path,
+            content,
+            ast: None,
+        };
+
         // Parse AST once if we have AST rules
         let tree = if !ast_rules.is_empty() {
             file.language
-                .and_then(|lang| self.parse_ast(&content, lang))
+                .and_then(|lang| self.parse_ast(parsers, content, lang))
         } else {
             None
         };
 
-        // Execute AST rules with the parsed tree (in parallel)
+        // Execute AST rules with the shared parsed tree
         if let Some(ref tree) = tree {
-            let ast_violations: Vec<Violation> = ast_rules
-                .par_iter()
-                .flat_map(|&rule| {
-                    // Try to downcast to AstRule to use execute_with_tree
-                    if let Some(ast_rule) = self.try_downcast_ast_rule(rule) {
-                        ast_rule.execute_with_tree(tree, &content, &file.path)
-                    } else {
-                        // Fallback to regular execute (will re-parse internally)
-                        let ctx = ExecutionContext {
-                            file_path: &file.path,
-                            content: &content,
-                            ast: None,
-                        };
-                        rule.execute(&ctx)
-                    }
-                })
-                .collect();
-            all_violations.extend(ast_violations);
+            for ast_rule in &ast_rules {
+                all_violations.extend(ast_rule.execute_with_tree(tree, content, &file.path));
+            }
         }
 
-        // Execute regex rules (in parallel)
-        let regex_violations: Vec<Violation> = regex_rules
-            .par_iter()
-            .flat_map(|&rule| {
-                let ctx = ExecutionContext {
-                    file_path: &file.path,
-                    content: &content,
-                    ast: None,
-                };
-                rule.execute(&ctx)
+        // Rules of any other kind handle their own processing
+        for rule in &other_rules {
+            all_violations.extend(rule.execute(&ctx));
+        }
+
+        // Execute regex rules in two stages: find raw matches for every rule,
+        // then build the line index only if something matched
+        let regex_matches: Vec<(&RegexRule, Vec<Range<usize>>)> = regex_rules
+            .iter()
+            .filter_map(|&regex_rule| {
+                let matches = regex_rule.find_matches(&ctx);
+                (!matches.is_empty()).then_some((regex_rule, matches))
             })
             .collect();
-        all_violations.extend(regex_violations);
+
+        if !regex_matches.is_empty() {
+            let line_index = LineIndex::new(content);
+            for (regex_rule, matches) in &regex_matches {
+                all_violations.extend(regex_rule.violations_for_matches(
+                    &ctx,
+                    matches,
+                    &line_index,
+                ));
+            }
+        }
 
         all_violations
     }
@@ -174,48 +216,44 @@ impl ExecutionEngine {
 
         let languages = rule.languages();
 
-        // If rule has no language restriction, it applies to all program files
-        if languages.is_empty() {
-            return true;
+        // If rule has no language restriction, it applies to all program files;
+        // otherwise the file's language must be in the rule's language list
+        if !languages.is_empty() && !languages.contains(&file_lang) {
+            return false;
         }
 
-        // Check if file's language is in rule's language list
-        languages.contains(&file_lang)
-    }
-
-    /// Check if a rule is an AST rule
-    ///
-    /// This is a heuristic based on the rule's type. We check if we can downcast to AstRule.
-    fn is_ast_rule(&self, rule: &dyn Rule) -> bool {
-        // Try to get the concrete type - this is a bit of a hack but works
-        // We try to downcast to AstRule via Any trait
-        // Since we don't have access to Any here, we use a simple heuristic:
-        // AST rules have exactly one language (they're language-specific)
-        let languages = rule.languages();
-        languages.len() == 1
-    }
-
-    /// Try to downcast a rule to AstRule
-    ///
-    /// This uses unsafe pointer casting to downcast the trait object.
-    /// Returns None if the rule is not an AstRule.
-    fn try_downcast_ast_rule<'a>(&self, _rule: &'a dyn Rule) -> Option<&'a AstRule> {
-        // We need a better way to do this - for now, we'll just use the execute method
-        // and not try to downcast. The AstRule.execute() will handle parsing internally.
-        None
+        // Check the rule's include/exclude patterns last, since glob matching
+        // is more expensive than the language comparison
+        rule.applies_to_path(&file.path)
     }
 
     /// Parse AST for a given language
-    fn parse_ast(&self, content: &str, language: Language) -> Option<tree_sitter::Tree> {
-        let mut parser: tree_sitter::Parser = match self.parser_cache.get_parser(language) {
-            Ok(p) => p,
-            Err(e) => {
-                eprintln!("Warning: Failed to get parser for {:?}: {}", language, e);
-                return None;
-            }
+    ///
+    /// Parsers are created on first use for each language and kept in
+    /// `parsers`, so a rayon job reuses one parser per language across files.
+    fn parse_ast(
+        &self,
+        parsers: &mut HashMap<Language, tree_sitter::Parser>,
+        content: &str,
+        language: Language,
+    ) -> Option<tree_sitter::Tree> {
+        let parser = match parsers.entry(language) {
+            Entry::Occupied(entry) => entry.into_mut(),
+            Entry::Vacant(entry) => match self.parser_cache.get_parser(language) {
+                Ok(p) => entry.insert(p),
+                Err(e) => {
+                    eprintln!("Warning: Failed to get parser for {:?}: {}", language, e);
+                    return None;
+                }
+            },
         };
 
-        parser.parse(content, None)
+        let tree = parser.parse(content, None);
+        if tree.is_none() {
+            // Make sure a failed parse doesn't leak state into the next file
+            parser.reset();
+        }
+        tree
     }
 }
 
@@ -223,7 +261,7 @@ impl ExecutionEngine {
 mod tests {
     use super::*;
     use crate::engine::file_walker::LanguageDetector;
-    use crate::rules::RegexRule;
+    use std::fs;
     use std::path::PathBuf;
     use tempfile::TempDir;
 
@@ -380,13 +418,36 @@ languages = ["rust"]
     }
 
     #[test]
-    fn test_is_ast_rule_heuristic() {
+    fn test_rule_applies_to_file_with_exclude() {
         let registry = RuleRegistry::new();
         let engine = ExecutionEngine::new(registry);
 
+        let toml = r#"
+[rule]
+id = "no-tests"
+description = "Not in tests"
+severity = "warning"
+
+[match]
+pattern = "TODO"
+exclude = ["tests/**"]
+"#;
+        let rule = RegexRule::from_toml(toml).unwrap();
+
+        let src_file = FileEntry::with_language(PathBuf::from("src/lib.rs"), Some(Language::Rust));
+        let test_file =
+            FileEntry::with_language(PathBuf::from("tests/it.rs"), Some(Language::Rust));
+
+        assert!(engine.rule_applies_to_file(&rule, &src_file));
+        assert!(!engine.rule_applies_to_file(&rule, &test_file));
+    }
+
+    #[test]
+    fn test_regex_rules_are_not_ast_rules() {
         // Regex rule with no language restrictions
         let regex_rule = create_test_regex_rule();
-        assert!(!engine.is_ast_rule(&regex_rule));
+        assert!(regex_rule.as_regex_rule().is_some());
+        assert!(regex_rule.as_ast_rule().is_none());
 
         // Regex rule with multiple languages
         let toml = r#"
@@ -400,7 +461,23 @@ pattern = "TODO"
 languages = ["rust", "python"]
 "#;
         let multi_lang_rule = RegexRule::from_toml(toml).unwrap();
-        assert!(!engine.is_ast_rule(&multi_lang_rule));
+        assert!(multi_lang_rule.as_regex_rule().is_some());
+        assert!(multi_lang_rule.as_ast_rule().is_none());
+
+        // Regex rule restricted to a single language is still a regex rule
+        let toml = r#"
+[rule]
+id = "python-only"
+description = "Python only rule"
+severity = "warning"
+
+[match]
+pattern = "TODO"
+languages = ["python"]
+"#;
+        let single_lang_rule = RegexRule::from_toml(toml).unwrap();
+        assert!(single_lang_rule.as_regex_rule().is_some());
+        assert!(single_lang_rule.as_ast_rule().is_none());
     }
 
     #[cfg(feature = "lang-rust")]
@@ -409,10 +486,15 @@ languages = ["rust", "python"]
         let registry = RuleRegistry::new();
         let engine = ExecutionEngine::new(registry);
 
-        let content = "fn main() {}";
-        let tree = engine.parse_ast(content, Language::Rust);
+        let mut parsers = HashMap::new();
+        let tree = engine.parse_ast(&mut parsers, "fn main() {}", Language::Rust);
+        assert!(tree.is_some());
 
+        // The parser is cached and reused for the next file
+        assert_eq!(parsers.len(), 1);
+        let tree = engine.parse_ast(&mut parsers, "fn other() {}", Language::Rust);
         assert!(tree.is_some());
+        assert_eq!(parsers.len(), 1);
     }
 
     #[test]
@@ -5,9 +5,8 @@
 
 use crate::types::{GlobPattern, Language};
 use globset::{Glob, GlobSetBuilder};
-use ignore::WalkBuilder;
 use ignore::types::{Types, TypesBuilder};
-use std::collections::HashMap;
+use ignore::{Match, WalkBuilder};
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 use thiserror::Error;
@@ -35,53 +34,71 @@ pub enum FileWalkerError {
 /// `.vue`, `.cjs`, `.mjs` for JavaScript, and `.pyi` for Python.
 #[derive(Clone)]
 pub struct LanguageDetector {
-    /// Map from Language to its Types matcher
-    matchers: Arc<HashMap<Language, Types>>,
+    /// Single Types matcher selecting every supported language, so detection
+    /// is one glob-set match per file rather than one per language
+    types: Arc<Types>,
+    /// Languages successfully selected in `types`
+    languages: Vec<Language>,
 }
 
 impl LanguageDetector {
     /// Creates a new LanguageDetector with matchers for all supported languages.
     ///
-    /// If building a matcher for a language fails, that language is logged and skipped.
+    /// All languages are selected in one builder. Only if that build fails is
+    /// each language probed on its own, so a failing language can be logged
+    /// and skipped.
     pub fn new() -> Self {
-        let mut matchers = HashMap::new();
-
-        for lang in Language::all() {
-            let type_name = lang.ignore_type_name();
-            let mut builder = TypesBuilder::new();
-            builder.add_defaults();
-            builder.select(type_name);
+        let all: Vec<Language> = Language::all().collect();
+        if let Ok(types) = build_types(&all) {
+            return Self {
+                types: Arc::new(types),
+                languages: all,
+            };
+        }
 
-            match builder.build() {
-                Ok(types) => {
-                    matchers.insert(lang, types);
-                }
+        let mut languages = Vec::new();
+        for lang in all {
+            match build_types(&[lang]) {
+                Ok(_) => languages.push(lang),
                 Err(e) => {
                     eprintln!(
                         "Warning: Failed to build language detector for {}: {}",
-                        type_name, e
+                        lang.ignore_type_name(),
+                        e
                     );
                 }
             }
         }
 
+        let types = match build_types(&languages) {
+            Ok(types) => types,
+            Err(e) => {
+                eprintln!("Warning: Failed to build language detector: {}", e);
+                languages.clear();
+                Types::empty()
+            }
+        };
+
         Self {
-            matchers: Arc::new(matchers),
+            types: Arc::new(types),
+            languages,
         }
     }
 
     /// Detects the language of a file based on its path.
     ///
-    /// Returns the first matching language, or None if no language matches.
+    /// Returns the language whose file type matched, or None if no language matches.
     pub fn detect(&self, path: &Path) -> Option<Language> {
-        for lang in Language::all() {
-            if let Some(types) = self.matchers.get(&lang)
-                && types.matched(path, false).is_whitelist()
-            {
-                return Some(lang);
+        match self.types.matched(path, false) {
+            Match::Whitelist(glob) => {
+                let name = glob.file_type_def()?.name();
+                self.languages
+                    .iter()
+                    .copied()
+                    .find(|lang| lang.ignore_type_name() == name)
             }
+            _ => None,
         }
-        None
     }
 }
 
@@ -91,10 +108,20 @@ impl Default for LanguageDetector {
     }
 }
 
+/// Build a Types matcher selecting the default file types of `languages`
+fn build_types(languages: &[Language]) -> Result<Types, ignore::Error> {
+    let mut builder = TypesBuilder::new();
+    builder.add_defaults();
+    for lang in languages {
+        builder.select(lang.ignore_type_name());
+    }
+    builder.build()
+}
+
 impl std::fmt::Debug for LanguageDetector {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         f.debug_struct("LanguageDetector")
-            .field("languages", &self.matchers.keys().collect::<Vec<_>>())
+            .field("languages", &self.languages)
             .finish()
     }
 }
@@ -189,6 +216,10 @@ impl FileWalker {
         let walker = WalkBuilder::new(root)
             .hidden(false) // Don't skip hidden files by default
             .git_ignore(true) // Respect .gitignore
+            // Always skip .git directories without descending into them
+            .filter_entry(|entry| {
+                !(entry.file_name() == ".git" && entry.file_type().is_some_and(|ft| ft.is_dir()))
+            })
             .build();
 
         let include_set = if include.is_empty() {
@@ -197,11 +228,11 @@ impl FileWalker {
             Some(Self::build_globset(include)?)
         };
 
-        // Always exclude .git directory, merging with user-provided excludes
-        let mut exclude_patterns = Vec::from(exclude);
-        exclude_patterns.push(GlobPattern::new("**/.git/**"));
-
-        let exclude_set = Some(Self::build_globset(&exclude_patterns)?);
+        let exclude_set = if exclude.is_empty() {
+            None
+        } else {
+            Some(Self::build_globset(exclude)?)
+        };
 
         let language_detector = LanguageDetector::new();
 
@@ -293,11 +324,9 @@ impl FileWalker {
                         }
                     }
 
-                    // Create FileEntry and check if it has a recognized language
-                    let file_entry = FileEntry::new(path.to_path_buf(), &language_detector);
-
                     // Filter out non-program files (no recognized language)
-                    if file_entry.language.is_none() {
+                    let language = language_detector.detect(path);
+                    if language.is_none() {
                         if verbose {
                             return Some(Ok(WalkResult::Skipped {
                                 path: path.to_path_buf(),
@@ -308,6 +337,8 @@ impl FileWalker {
                         }
                     }
 
+                    // Take ownership of the entry's path rather than copying it
+                    let file_entry = FileEntry::with_language(entry.into_path(), language);
                     Some(Ok(WalkResult::File(file_entry)))
                 }
                 Err(e) => Some(Err(FileWalkerError::Walk(e))),
@@ -325,7 +356,7 @@ mod tests {
     fn test_language_detector_new() {
         let detector = LanguageDetector::new();
         // Should have matchers for all languages
-        assert!(detector.matchers.len() >= 5);
+        assert_eq!(detector.languages, Language::all().collect::<Vec<_>>());
     }
 
     #[test]
@@ -519,4 +550,40 @@ mod tests {
         // Cleanup
         let _ = fs::remove_dir_all(&temp_dir);
     }
+
+    #[test]
+    fn test_walk_skips_git_directory() {
+        let temp_dir = std::env::temp_dir().join("ratchet_test_walk_skip_git");
+        let _ = fs::remove_dir_all(&temp_dir);
+        fs::create_dir_all(temp_dir.join(".git").join("hooks")).expect("Failed to create .git");
+
+        fs::write(temp_dir.join("main.rs"), "fn main() {}").expect("Failed to write main.rs");
+        fs::write(
+            temp_dir.join(".git").join("hooks").join("hook.py"),
+            "print()",
+        )
+        .expect("Failed to write hook.py");
+
+        let walker =
+            FileWalker::with_verbose(&temp_dir, &[], &[], true).expect("Failed to create walker");
+        let results: Vec<_> = walker
+            .walk_with_skip_info()
+            .filter_map(Result::ok)
+            .collect();
+
+        // Nothing under .git is scanned or even visited
+        assert!(results.iter().all(|result| {
+            let path = match result {
+                WalkResult::File(file) => &file.path,
+                WalkResult::Skipped { path, .. } => path,
+            };
+            !path.components().any(|c| c.as_os_str() == ".git")
+        }));
+        assert!(results.iter().any(
+            |result| matches!(result, WalkResult::File(file) if file.path.ends_with("main.rs"))
+        ));
+
+        // Cleanup
+        let _ = fs::remove_dir_all(&temp_dir);
+    }
 }
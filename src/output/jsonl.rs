@@ -9,6 +9,7 @@
 
 use crate::engine::aggregator::AggregationResult;
 use serde::Serialize;
+use std::io::{self, BufWriter, Write};
 use std::path::PathBuf;
 
 /// JSONL output formatter
@@ -34,8 +35,46 @@ impl JsonlFormatter {
     /// * `result` - The aggregation result to format
     /// * `verbose` - If true, output violation records. If false, skip violation records.
     pub fn format(&self, result: &AggregationResult, verbose: bool) -> String {
-        let mut output = String::new();
+        let mut output = Vec::new();
+        // The only errors write_to returns come from the writer, and writing
+        // to a Vec cannot fail, so the result is safe to ignore
+        let _ = self.write_to(&mut output, result, verbose);
+        // serde_json only emits UTF-8, so the lossy fallback never runs; it
+        // only keeps this path free of a panic
+        String::from_utf8(output)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
+    }
 
+    /// Write the aggregation result as JSONL to stdout
+    ///
+    /// Records are streamed through a buffered, locked stdout handle as they
+    /// are serialized, rather than building the whole output in memory first.
+    ///
+    /// # Arguments
+    ///
+    /// * `result` - The aggregation result to format
+    /// * `verbose` - If true, output violation records. If false, skip violation records.
+    pub fn write_to_stdout(&self, result: &AggregationResult, verbose: bool) -> io::Result<()> {
+        let mut stdout = BufWriter::new(io::stdout().lock());
+        self.write_to(&mut stdout, result, verbose)?;
+        stdout.flush()
+    }
+
+    /// Write the aggregation result as JSONL to the given writer
+    ///
+    /// Produces the same records in the same order as `format`.
+    ///
+    /// # Arguments
+    ///
+    /// * `writer` - Destination for the JSONL records
+    /// * `result` - The aggregation result to format
+    /// * `verbose` - If true, output violation records. If false, skip violation records.
+    pub fn write_to<W: Write>(
+        &self,
+        writer: &mut W,
+        result: &AggregationResult,
+        verbose: bool,
+    ) -> io::Result<()> {
         // Only output violation records if verbose is true
         if verbose {
             // Collect all violations from all statuses
@@ -67,10 +106,7 @@ impl JsonlFormatter {
 
             // Output all violation records
             for violation in all_violations {
-                if let Ok(json) = serde_json::to_string(&violation) {
-                    output.push_str(&json);
-                    output.push('\n');
-                }
+                write_record(writer, &violation)?;
             }
         }
 
@@ -92,10 +128,7 @@ impl JsonlFormatter {
 
         // Output all summary records
         for summary in summaries {
-            if let Ok(json) = serde_json::to_string(&summary) {
-                output.push_str(&json);
-                output.push('\n');
-            }
+            write_record(writer, &summary)?;
         }
 
         // Output status record
@@ -108,12 +141,21 @@ impl JsonlFormatter {
             total_violations: result.total_violations as u64,
         };
 
-        if let Ok(json) = serde_json::to_string(&status) {
-            output.push_str(&json);
-            output.push('\n');
-        }
+        write_record(writer, &status)
+    }
+}
 
-        output
+/// Write one record as a line of JSON
+///
+/// Records that fail to serialize (e.g. a path that is not valid UTF-8) are
+/// skipped, so a partial record is never written.
+fn write_record<W: Write, T: Serialize>(writer: &mut W, record: &T) -> io::Result<()> {
+    match serde_json::to_vec(record) {
+        Ok(json) => {
+            writer.write_all(&json)?;
+            writer.write_all(b"\n")
+        }
+        Err(_) => Ok(()),
     }
 }
 
@@ -1044,4 +1086,44 @@ mod tests {
         assert_eq!(status["rules_exceeded"], 1);
         assert_eq!(status["total_violations"], 3);
     }
+
+    /// Writer that accepts a fixed number of bytes and then fails
+    struct FailingWriter {
+        remaining: usize,
+    }
+
+    impl Write for FailingWriter {
+        fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
+            if self.remaining == 0 {
+                return Err(io::Error::other("disk full"));
+            }
+            let n = buf.len().min(self.remaining);
+            self.remaining -= n;
+            Ok(n)
+        }
+
+        fn flush(&mut self) -> io::Result<()> {
+            Ok(())
+        }
+    }
+
+    #[test]
+    fn test_write_to_propagates_writer_errors() {
+        let formatter = JsonlFormatter::new();
+
+        let violations = vec![create_test_violation(
+            "rule-a", "src/a.rs", "src", 10, 5, "snippet", "message",
+        )];
+        let result = AggregationResult {
+            statuses: vec![create_test_status("rule-a", "src", 1, 0, violations)],
+            passed: false,
+            total_violations: 1,
+            violations_over_budget: 1,
+        };
+
+        // Fail partway through the first record
+        let mut writer = FailingWriter { remaining: 20 };
+        let err = formatter.write_to(&mut writer, &result, true).unwrap_err();
+        assert_eq!(err.to_string(), "disk full");
+    }
 }
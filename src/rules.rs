@@ -11,6 +11,6 @@ mod rule;
 // Re-export core types
 pub use ast::{AstRule, ParserCache};
 pub use builtin::{load_builtin_ast_rules, load_builtin_regex_rules};
-pub use regex_rule::RegexRule;
+pub use regex_rule::{LineIndex, RegexRule};
 pub use registry::RuleRegistry;
 pub use rule::{AstPlaceholder, ExecutionContext, Rule, RuleContext, Violation};
@@ -59,7 +59,12 @@ pub struct AstRule {
     id: RuleId,
     description: String,
     severity: Severity,
+    /// Query source text, kept only for the `Debug` impl
     query_source: String,
+    /// Query compiled once at load time and shared across all files
+    query: Query,
+    /// Index of the @violation capture (or 0 if the query has none)
+    violation_capture_idx: usize,
     language: Language,
     include: Option<GlobSet>,
     exclude: Option<GlobSet>,
@@ -135,11 +140,17 @@ impl AstRule {
             RuleError::InvalidDefinition(format!("Invalid rule ID: {}", def.rule.id))
         })?;
 
-        // Store query source for later compilation
+        // Compile the query once; it is reused for every file this rule checks.
+        // The source is kept only so Debug output can show it.
         let query_source = def.match_section.query;
+        let query = compile_query(&query_source, def.match_section.language)?;
 
-        // Validate the query can be compiled (we'll compile it fresh each time we need it)
-        validate_query(&query_source, def.match_section.language)?;
+        // Find the @violation capture index, or use 0 if not found
+        let violation_capture_idx = query
+            .capture_names()
+            .iter()
+            .position(|name| *name == "violation")
+            .unwrap_or(0);
 
         // Build include GlobSet if specified
         let include = if let Some(patterns) = def.match_section.include {
@@ -167,6 +178,8 @@ impl AstRule {
             description: def.rule.description,
             severity: def.rule.severity,
             query_source,
+            query,
+            violation_capture_idx,
             language: def.match_section.language,
             include,
             exclude,
@@ -207,7 +220,9 @@ impl AstRule {
     /// Execute the query with an actual tree-sitter tree
     ///
     /// This method performs the actual query execution against a parsed tree.
-    /// It's called by the Rule trait's execute() method when a tree is available.
+    /// The execution engine calls it with a tree parsed once per file and
+    /// shared across all AST rules; the Rule trait's execute() method calls it
+    /// after parsing the file itself.
     ///
     /// # Parameters
     ///
@@ -224,40 +239,16 @@ impl AstRule {
         content: &str,
         file_path: &Path,
     ) -> Vec<Violation> {
-        // Compile the query
-        let parser_cache = ParserCache::new();
-        let parser = match parser_cache.get_parser(self.language) {
-            Ok(p) => p,
-            Err(_) => return vec![],
-        };
-
-        let tree_sitter_lang = match parser.language() {
-            Some(lang) => lang,
-            None => return vec![], // Parser not properly configured
-        };
-
-        let query = match Query::new(&tree_sitter_lang, &self.query_source) {
-            Ok(q) => q,
-            Err(_) => return vec![],
-        };
-
-        // Find the @violation capture index, or use 0 if not found
-        let violation_capture_idx = query
-            .capture_names()
-            .iter()
-            .position(|name| *name == "violation")
-            .unwrap_or(0);
-
         // Execute query
         let mut cursor = QueryCursor::new();
-        let matches = cursor.matches(&query, tree.root_node(), content.as_bytes());
+        let matches = cursor.matches(&self.query, tree.root_node(), content.as_bytes());
 
         let mut violations = Vec::new();
 
         for match_result in matches {
             // Apply post-filter if specified
             if let Some(filter) = self.post_filter
-                && !apply_post_filter(filter, &query, &match_result, content)
+                && !apply_post_filter(filter, &self.query, &match_result, content)
             {
                 continue;
             }
@@ -266,7 +257,7 @@ impl AstRule {
             let capture = if let Some(capture) = match_result
                 .captures
                 .iter()
-                .find(|c| c.index as usize == violation_capture_idx)
+                .find(|c| c.index as usize == self.violation_capture_idx)
             {
                 capture
             } else if let Some(first) = match_result.captures.first() {
@@ -313,8 +304,8 @@ impl AstRule {
     }
 }
 
-/// Validate that a query can be compiled for the given language
-fn validate_query(query_source: &str, language: Language) -> Result<(), RuleError> {
+/// Compile a query for the given language
+fn compile_query(query_source: &str, language: Language) -> Result<Query, RuleError> {
     let parser_cache = ParserCache::new();
     let parser = parser_cache
         .get_parser(language)
@@ -325,9 +316,7 @@ fn validate_query(query_source: &str, language: Language) -> Result<(), RuleErro
         .ok_or_else(|| RuleError::InvalidQuery("Parser language not configured".to_string()))?;
 
     Query::new(&tree_sitter_lang, query_source)
-        .map_err(|e| RuleError::InvalidQuery(format!("Failed to compile query: {}", e)))?;
-
-    Ok(())
+        .map_err(|e| RuleError::InvalidQuery(format!("Failed to compile query: {}", e)))
 }
 
 /// Build a GlobSet from a list of glob patterns or references
@@ -504,9 +493,17 @@ impl Rule for AstRule {
             None => return vec![],
         };
 
-        // Execute the query using our stored query_source
+        // Execute the precompiled query
         self.execute_with_tree(&tree, ctx.content, ctx.file_path)
     }
+
+    fn applies_to_path(&self, path: &Path) -> bool {
+        self.applies_to_file(path)
+    }
+
+    fn as_ast_rule(&self) -> Option<&AstRule> {
+        Some(self)
+    }
 }
 
 #[cfg(test)]
@@ -537,6 +534,28 @@ language = "rust"
         assert!(rule.exclude.is_none());
     }
 
+    #[cfg(feature = "lang-rust")]
+    #[test]
+    fn test_as_ast_rule() {
+        let toml = r#"
+[rule]
+id = "test-ast-rule"
+description = "Test AST rule"
+severity = "error"
+
+[match]
+query = """
+(identifier) @violation
+"""
+language = "rust"
+"#;
+
+        let rule = AstRule::from_toml(toml).unwrap();
+        let dyn_rule: &dyn Rule = &rule;
+        assert!(dyn_rule.as_ast_rule().is_some());
+        assert!(dyn_rule.as_regex_rule().is_none());
+    }
+
     #[test]
     fn test_from_toml_with_globs() {
         let toml = r#"
@@ -11,6 +11,7 @@ use crate::types::{GlobPattern, Language, RegionPath, RuleId, Severity};
 use globset::{Glob, GlobSet, GlobSetBuilder};
 use regex::Regex;
 use serde::Deserialize;
+use std::ops::Range;
 use std::path::Path;
 
 /// TOML structure for regex rule definitions
@@ -57,6 +58,9 @@ pub struct RegexRule {
     id: RuleId,
     description: String,
     severity: Severity,
+    /// Compiled pattern. Plain literal patterns (e.g. `yaml`) need no special
+    /// casing: the regex crate detects them and searches with a vectorized
+    /// substring finder, which outperforms `str::match_indices`.
     pattern: Regex,
     languages: Vec<Language>,
     include: Option<GlobSet>,
@@ -184,6 +188,58 @@ impl RegexRule {
             true
         }
     }
+
+    /// Find the byte ranges of all matches of this rule in a file
+    ///
+    /// This is the cheap first stage of execution: the regex engine skips
+    /// ahead using its literal prefilters, and no line/column information is
+    /// computed. Include/exclude patterns are not checked here; callers are
+    /// expected to have filtered with `applies_to_path` already.
+    pub fn find_matches(&self, ctx: &ExecutionContext) -> Vec<Range<usize>> {
+        self.pattern
+            .find_iter(ctx.content)
+            .map(|m| m.range())
+            .collect()
+    }
+
+    /// Build violations from matches found by `find_matches`
+    ///
+    /// The line index is shared by every rule that matched in the file, so
+    /// it only has to be built for files with at least one match.
+    pub fn violations_for_matches(
+        &self,
+        ctx: &ExecutionContext,
+        matches: &[Range<usize>],
+        line_index: &LineIndex,
+    ) -> Vec<Violation> {
+        // Determine region from file path
+        let region = if let Some(parent) = ctx.file_path.parent() {
+            RegionPath::new(parent.to_string_lossy().to_string())
+        } else {
+            RegionPath::new(".")
+        };
+
+        matches
+            .iter()
+            .map(|range| {
+                // Calculate line/column positions
+                let (line, column) = line_index.line_col(range.start);
+                let (end_line, end_column) = line_index.line_col(range.end);
+
+                Violation {
+                    rule_id: self.id.clone(),
+                    file: ctx.file_path.to_path_buf(),
+                    line,
+                    column,
+                    end_line,
+                    end_column,
+                    snippet: ctx.content[range.clone()].to_string(),
+                    message: self.description.clone(),
+                    region: region.clone(),
+                }
+            })
+            .collect()
+    }
 }
 
 /// Build a GlobSet from a list of glob patterns or references
@@ -278,17 +334,47 @@ fn resolve_pattern_reference<'a>(
         })
 }
 
+/// Line start offsets for a single file
+///
+/// Building the index is a full pass over the file content, so the execution
+/// engine builds it once per file and shares it across every regex rule that
+/// runs against that file.
+#[derive(Debug, Clone)]
+pub struct LineIndex {
+    offsets: Vec<usize>,
+}
+
+impl LineIndex {
+    /// Build a line index for the given file content
+    pub fn new(content: &str) -> Self {
+        Self {
+            offsets: compute_line_offsets(content),
+        }
+    }
+
+    /// Convert a byte offset to line and column numbers (1-indexed)
+    pub fn line_col(&self, offset: usize) -> (u32, u32) {
+        offset_to_line_col(offset, &self.offsets)
+    }
+}
+
 /// Compute line start offsets for efficient line/column conversion
 ///
 /// Returns a vector where each element is the byte offset of the start of a line.
 /// Line 0 starts at offset 0.
+///
+/// Scans raw bytes rather than decoding chars: in UTF-8 the byte `\n` never
+/// appears inside a multi-byte sequence, so this finds the same offsets
+/// without per-character decoding.
 fn compute_line_offsets(content: &str) -> Vec<usize> {
     let mut offsets = vec![0];
-    for (i, c) in content.char_indices() {
-        if c == '\n' {
-            offsets.push(i + 1);
-        }
-    }
+    offsets.extend(
+        content
+            .bytes()
+            .enumerate()
+            .filter(|&(_, b)| b == b'\n')
+            .map(|(i, _)| i + 1),
+    );
     offsets
 }
 
@@ -330,44 +416,20 @@ impl Rule for RegexRule {
             return vec![];
         }
 
-        // Precompute line offsets for efficient position calculation
-        let line_offsets = compute_line_offsets(ctx.content);
-
-        // Find all matches
-        let mut violations = Vec::new();
-
-        for match_result in self.pattern.find_iter(ctx.content) {
-            let match_start = match_result.start();
-            let match_end = match_result.end();
-
-            // Extract snippet
-            let snippet = ctx.content[match_start..match_end].to_string();
+        let matches = self.find_matches(ctx);
+        if matches.is_empty() {
+            return vec![];
+        }
 
-            // Calculate line/column positions
-            let (line, column) = offset_to_line_col(match_start, &line_offsets);
-            let (end_line, end_column) = offset_to_line_col(match_end, &line_offsets);
+        self.violations_for_matches(ctx, &matches, &LineIndex::new(ctx.content))
+    }
 
-            // Determine region from file path
-            let region = if let Some(parent) = ctx.file_path.parent() {
-                RegionPath::new(parent.to_string_lossy().to_string())
-            } else {
-                RegionPath::new(".")
-            };
-
-            violations.push(Violation {
-                rule_id: self.id.clone(),
-                file: ctx.file_path.to_path_buf(),
-                line,
-                column,
-                end_line,
-                end_column,
-                snippet,
-                message: self.description.clone(),
-                region,
-            });
-        }
+    fn applies_to_path(&self, path: &Path) -> bool {
+        self.applies_to_file(path)
+    }
 
-        violations
+    fn as_regex_rule(&self) -> Option<&RegexRule> {
+        Some(self)
     }
 }
 
@@ -507,6 +569,14 @@ pattern = "test"
         assert_eq!(offsets, vec![0]);
     }
 
+    #[test]
+    fn test_compute_line_offsets_multibyte() {
+        // "é" and "→" are multi-byte in UTF-8; offsets are in bytes
+        let content = "é\n→x\n\nend";
+        let offsets = compute_line_offsets(content);
+        assert_eq!(offsets, vec![0, 3, 8, 9]);
+    }
+
     #[test]
     fn test_offset_to_line_col() {
         let content = "line1\nline2\nline3";
@@ -528,6 +598,62 @@ pattern = "test"
         assert_eq!(offset_to_line_col(12, &offsets), (3, 1));
     }
 
+    #[test]
+    fn test_line_index_line_col() {
+        let index = LineIndex::new("line1\nline2\nline3");
+        assert_eq!(index.line_col(0), (1, 1));
+        assert_eq!(index.line_col(6), (2, 1));
+        assert_eq!(index.line_col(14), (3, 3));
+    }
+
+    #[test]
+    fn test_violations_for_matches_matches_execute() {
+        let toml = r#"
+[rule]
+id = "no-todo"
+description = "No TODO"
+severity = "warning"
+
+[match]
+pattern = "TODO"
+"#;
+        let rule = RegexRule::from_toml(toml).unwrap();
+        let content = "fn main() {}\n// TODO: one\n// TODO: two\n";
+        let ctx = ExecutionContext {
+            file_path: Path::new("src/main.rs"),
+            content,
+            ast: None,
+        };
+
+        let matches = rule.find_matches(&ctx);
+        assert_eq!(matches, vec![16..20, 29..33]);
+
+        let index = LineIndex::new(content);
+        let shared = rule.violations_for_matches(&ctx, &matches, &index);
+        let standalone = rule.execute(&ctx);
+
+        assert_eq!(shared, standalone);
+        assert_eq!(shared.len(), 2);
+        assert_eq!((shared[1].line, shared[1].column), (3, 4));
+    }
+
+    #[test]
+    fn test_as_regex_rule() {
+        let toml = r#"
+[rule]
+id = "test-rule"
+description = "Test"
+severity = "error"
+
+[match]
+pattern = "TODO"
+languages = ["python"]
+"#;
+        let rule = RegexRule::from_toml(toml).unwrap();
+        let dyn_rule: &dyn Rule = &rule;
+        assert!(dyn_rule.as_regex_rule().is_some());
+    }
+
     #[test]
     fn test_execute_simple_match() {
         let toml = r#"
@@ -672,6 +798,37 @@ exclude = ["tests/**"]
         assert_eq!(violations.len(), 1);
     }
 
+    #[test]
+    fn test_execute_respects_exclude() {
+        let toml = r#"
+[rule]
+id = "test-rule"
+description = "Find TODO except in tests"
+severity = "warning"
+
+[match]
+pattern = "TODO"
+exclude = ["tests/**"]
+"#;
+
+        let rule = RegexRule::from_toml(toml).unwrap();
+
+        let ctx = ExecutionContext {
+            file_path: Path::new("tests/test.rs"),
+            content: "// TODO: fix",
+            ast: None,
+        };
+        assert!(rule.execute(&ctx).is_empty());
+
+        let ctx = ExecutionContext {
+            file_path: Path::new("src/main.rs"),
+            content: "// TODO: fix",
+            ast: None,
+        };
+        assert_eq!(rule.find_matches(&ctx), vec![3..7]);
+        assert_eq!(rule.execute(&ctx).len(), 1);
+    }
+
     #[test]
     fn test_case_insensitive_pattern() {
         let toml = r#"
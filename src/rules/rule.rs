@@ -2,6 +2,7 @@
 
 //! Core Rule trait and related types for defining and executing rules
 
+use crate::rules::{AstRule, RegexRule};
 use crate::types::{GlobPattern, Language, RegionPath, RuleId, Severity};
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
@@ -107,6 +108,31 @@ pub trait Rule: Send + Sync {
     /// Returns a vector of all violations found in the file.
     /// Returns an empty vector if no violations are found.
     fn execute(&self, ctx: &ExecutionContext) -> Vec<Violation>;
+
+    /// Returns whether this rule's include/exclude patterns admit the path
+    ///
+    /// The execution engine checks this before reading or parsing a file, so
+    /// files that no rule covers are skipped without any I/O. Rules without
+    /// path filters apply to every path.
+    fn applies_to_path(&self, _path: &Path) -> bool {
+        true
+    }
+
+    /// Returns this rule as a `RegexRule`, if it is one
+    ///
+    /// The execution engine uses this to run all regex rules for a file
+    /// against a single shared scan of that file.
+    fn as_regex_rule(&self) -> Option<&RegexRule> {
+        None
+    }
+
+    /// Returns this rule as an `AstRule`, if it is one
+    ///
+    /// The execution engine uses this to parse each file once and run all
+    /// AST rules against the shared tree.
+    fn as_ast_rule(&self) -> Option<&AstRule> {
+        None
+    }
 }
 
 #[cfg(test)]
@@ -25,6 +25,14 @@ fn builtin_rules_dir() -> PathBuf {
         .join("regex")
 }
 
+/// Helper function to get the builtin Python rules directory path
+fn builtin_python_rules_dir() -> PathBuf {
+    PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .join("builtin-ratchets")
+        .join("python")
+        .join("regex")
+}
+
 /// Helper function to load a fixture file's content
 fn load_fixture(filename: &str) -> String {
     let path = fixtures_dir().join(filename);
@@ -39,6 +47,13 @@ fn load_builtin_rule(rule_name: &str) -> RegexRule {
         .unwrap_or_else(|e| panic!("Failed to load built-in rule {}: {}", rule_name, e))
 }
 
+/// Helper function to load a built-in Python rule
+fn load_builtin_python_rule(rule_name: &str) -> RegexRule {
+    let path = builtin_python_rules_dir().join(format!("{}.toml", rule_name));
+    RegexRule::from_path(&path)
+        .unwrap_or_else(|e| panic!("Failed to load built-in rule {}: {}", rule_name, e))
+}
+
 #[test]
 fn test_todo_rule_finds_todos() {
     // Load the no-todo-comments built-in rule
@@ -491,3 +506,171 @@ fn test_only_whitespace() {
     // Whitespace-only file should have no violations
     assert_eq!(violations.len(), 0);
 }
+
+#[test]
+fn test_docstring_rules_find_sections() {
+    let args_rule = load_builtin_python_rule("no-args-in-docstrings");
+    let returns_rule = load_builtin_python_rule("no-returns-in-docstrings");
+
+    let content = r#"def add(a, b):
+    """Add two numbers.
+
+    Args:
+        a: first "operand"
+        b: second operand
+
+    Returns:
+        The sum
+    """
+    return a + b
+"#;
+    let ctx = ExecutionContext {
+        file_path: Path::new("math.py"),
+        content,
+        ast: None,
+    };
+
+    let args_violations = args_rule.execute(&ctx);
+    assert_eq!(args_violations.len(), 1);
+    assert_eq!(args_violations[0].line, 2);
+    assert_eq!(args_violations[0].end_line, 4);
+
+    let returns_violations = returns_rule.execute(&ctx);
+    assert_eq!(returns_violations.len(), 1);
+    assert_eq!(returns_violations[0].end_line, 8);
+}
+
+#[test]
+fn test_docstring_rules_long_docstring() {
+    let rule = load_builtin_python_rule("no-args-in-docstrings");
+
+    // A section after a few paragraphs of description is still found
+    let content = format!(
+        "def f(x):\n    \"\"\"Summary.\n\n{}\n    Args:\n        x: value\n    \"\"\"\n",
+        "    Long description line.\n".repeat(10)
+    );
+    let ctx = ExecutionContext {
+        file_path: Path::new("long.py"),
+        content: &content,
+        ast: None,
+    };
+    assert_eq!(rule.execute(&ctx).len(), 1);
+
+    // Long docstrings without the section don't match
+    let content = format!(
+        "def f(x):\n    \"\"\"Summary.\n\n{}\n    \"\"\"\n",
+        "    Long description line.\n".repeat(10_000)
+    );
+    let ctx = ExecutionContext {
+        file_path: Path::new("long.py"),
+        content: &content,
+        ast: None,
+    };
+    assert!(rule.execute(&ctx).is_empty());
+}
+
+#[test]
+fn test_docstring_rules_match_within_500_bytes() {
+    let args_rule = load_builtin_python_rule("no-args-in-docstrings");
+    let returns_rule = load_builtin_python_rule("no-returns-in-docstrings");
+
+    // The patterns look up to 500 bytes past any `"""`, including a closing
+    // one, so section names in nearby code are still reported
+    let content = "\"\"\"Module docstring.\"\"\"\n\nparser.add_argument_group(\"Args:\")\nlabel = \"Returns:\"\n";
+    let ctx = ExecutionContext {
+        file_path: Path::new("cli.py"),
+        content,
+        ast: None,
+    };
+    assert_eq!(args_rule.execute(&ctx).len(), 1);
+    assert_eq!(returns_rule.execute(&ctx).len(), 1);
+
+    // Section names more than 500 bytes after the last `"""` are not
+    let content = format!(
+        "\"\"\"Module docstring.\"\"\"\n\n{}\n# Args: see below\nparser.add_argument_group(\"Args:\")\nlabel = \"Returns:\"\n",
+        "value = compute(value)\n".repeat(50)
+    );
+    let ctx = ExecutionContext {
+        file_path: Path::new("cli.py"),
+        content: &content,
+        ast: None,
+    };
+    assert!(args_rule.execute(&ctx).is_empty());
+    assert!(returns_rule.execute(&ctx).is_empty());
+}
+
+#[test]
+fn test_module_import_rules() {
+    let content = "import asyncio\nfrom asyncio import run\nimport pandas as pd\nfrom dataclasses import dataclass\nimport asyncio_extras\nfrom mypandas import x\n";
+    let ctx = ExecutionContext {
+        file_path: Path::new("imports.py"),
+        content,
+        ast: None,
+    };
+
+    let asyncio = load_builtin_python_rule("no-asyncio-import").execute(&ctx);
+    let snippets: Vec<&str> = asyncio.iter().map(|v| v.snippet.as_str()).collect();
+    assert_eq!(snippets, vec!["import asyncio", "from asyncio"]);
+
+    let pandas = load_builtin_python_rule("no-pandas-import").execute(&ctx);
+    assert_eq!(pandas.len(), 1);
+    assert_eq!(pandas[0].line, 3);
+
+    let dataclasses = load_builtin_python_rule("no-dataclasses-import").execute(&ctx);
+    assert_eq!(dataclasses.len(), 1);
+    assert_eq!(dataclasses[0].snippet, "from dataclasses");
+}
+
+#[test]
+fn test_literal_pattern_rule() {
+    let rule = load_builtin_python_rule("no-yaml-usage");
+
+    let content = "import yaml\n\nconfig = yaml.safe_load(open(\"a.yaml\"))\n";
+    let ctx = ExecutionContext {
+        file_path: Path::new("config.py"),
+        content,
+        ast: None,
+    };
+
+    let violations = rule.execute(&ctx);
+    let positions: Vec<(u32, u32)> = violations.iter().map(|v| (v.line, v.column)).collect();
+    assert_eq!(positions, vec![(1, 8), (3, 10), (3, 33)]);
+}
+
+#[test]
+fn test_inline_imports_rule() {
+    let rule = load_builtin_python_rule("no-inline-imports");
+
+    let content = "import os\nfrom typing import Any\n\ndef f():\n    import json\n\tfrom os import path\n    from_value = 1\n    important = 2\n";
+    let ctx = ExecutionContext {
+        file_path: Path::new("inline.py"),
+        content,
+        ast: None,
+    };
+
+    let violations = rule.execute(&ctx);
+    let lines: Vec<u32> = violations.iter().map(|v| v.line).collect();
+    assert_eq!(lines, vec![5, 6]);
+    assert_eq!(violations[0].snippet, "    import json");
+    assert_eq!(violations[1].snippet, "\tfrom os import");
+}
+
+#[test]
+fn test_trailing_comments_rule_long_lines() {
+    let rule = load_builtin_python_rule("no-trailing-comments");
+
+    // Many `#` candidates on one line still produce a single match per line;
+    // the regex engine runs in linear time, so this stays fast
+    let long_line = format!("value = 1{}\n", " #".repeat(50_000));
+    let content = format!("# header comment\n{long_line}x = 2  # trailing\n");
+    let ctx = ExecutionContext {
+        file_path: Path::new("comments.py"),
+        content: &content,
+        ast: None,
+    };
+
+    let violations = rule.execute(&ctx);
+    let lines: Vec<u32> = violations.iter().map(|v| v.line).collect();
+    assert_eq!(lines, vec![2, 3]);
+    assert_eq!(violations[0].snippet.len(), long_line.len() - 1);
+}